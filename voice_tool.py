@@ -6,31 +6,40 @@ Starts/stops recording and transcribes audio using faster-whisper
 
 import os
 import sys
+import asyncio
+import fcntl
 import subprocess
 import signal
+import socket
+import threading
 import time
 import json
 import shutil
 from pathlib import Path
 from datetime import datetime
 
-# Try to import required libraries
+# Prefer orjson (C, SIMD-accelerated) for parsing; fall back to stdlib json
 try:
-    from faster_whisper import WhisperModel
-    import pyperclip
-except ImportError as e:
-    print(f"Error: Missing required library: {e}")
-    print("Please run: pip install -r requirements.txt")
-    sys.exit(1)
+    import orjson as json_fast
+except ImportError:
+    json_fast = json
+
+# faster_whisper is imported lazily where needed: the start path never
+# pays its import cost (~400 ms)
 
 # Configuration file path
 CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.json")
 
+# Transcription daemon (keeps the Whisper model loaded between toggles)
+DAEMON_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "voice_toold.py")
+DAEMON_SOCKET = "/tmp/voice_toold.sock"
+
 # Default configuration
 DEFAULT_CONFIG = {
     "transcriptions_directory": "~/Documents/transcriptions",
     "transcriptions_file": "~/Documents/transcriptions.txt",  # Legacy: kept for backward compatibility
     "model_name": "base.en",
+    "beam_size": 1,
     "sample_rate": 16000,
     "channels": 1,
     "bit_depth": 16,
@@ -59,8 +68,8 @@ def load_config():
     
     if os.path.exists(CONFIG_FILE):
         try:
-            with open(CONFIG_FILE, "r") as f:
-                user_config = json.load(f)
+            with open(CONFIG_FILE, "rb") as f:
+                user_config = json_fast.loads(f.read())
                 config.update(user_config)
         except Exception as e:
             print(f"Warning: Could not load config file: {e}. Using defaults.")
@@ -97,6 +106,7 @@ HIGH_QUALITY_AUDIO_FILE = "/tmp/voice_capture_hq.wav"  # High quality recording
 TRANSCRIPTIONS_DIR = CONFIG["transcriptions_directory"]
 TRANSCRIPTIONS_FILE = CONFIG.get("transcriptions_file", "")  # Legacy support
 MODEL_NAME = CONFIG["model_name"]
+BEAM_SIZE = CONFIG.get("beam_size", 1)
 SAMPLE_RATE = CONFIG["sample_rate"]
 CHANNELS = CONFIG["channels"]
 BIT_DEPTH = CONFIG["bit_depth"]
@@ -110,30 +120,101 @@ HQ_SAMPLE_RATE = HQ_AUDIO_CONFIG.get("sample_rate", 44100)
 HQ_CHANNELS = HQ_AUDIO_CONFIG.get("channels", 2)
 HQ_BIT_DEPTH = HQ_AUDIO_CONFIG.get("bit_depth", 24)
 
+# Backend probe cache file (sibling of config.json)
+BACKEND_CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend_cache.json")
+
+
+# Per-process probe result (the tool paths also persist across invocations)
+_BACKENDS = None
+
+
+def probe_audio_backends():
+    """Detect available audio tools, caching tool paths across invocations
+
+    Uses shutil.which (a path scan, no fork) instead of spawning `which`,
+    and memoizes the tool paths to backend_cache.json keyed on the mtime
+    of /usr/bin so newly installed tools invalidate the cache. Whether
+    PulseAudio is *running* is live state that the disk cache can't know,
+    so `pactl info` is re-run once per process.
+    """
+    global _BACKENDS
+    if _BACKENDS is not None:
+        return _BACKENDS
+
+    try:
+        bin_mtime = os.stat("/usr/bin").st_mtime
+    except OSError:
+        bin_mtime = 0.0
+
+    # Tool paths: disk cache first, fresh which() scan on a miss
+    tools = None
+    try:
+        with open(BACKEND_CACHE_FILE, "rb") as f:
+            cached = json_fast.loads(f.read())
+        if cached.get("bin_mtime") == bin_mtime:
+            tools = cached
+    except Exception:
+        pass
+
+    if tools is None:
+        tools = {
+            "bin_mtime": bin_mtime,
+            "sox": shutil.which("sox"),
+            "ffmpeg": shutil.which("ffmpeg"),
+            "pactl": shutil.which("pactl")
+        }
+        try:
+            with open(BACKEND_CACHE_FILE, "w") as f:
+                json.dump(tools, f)
+        except Exception:
+            pass  # Cache is an optimization; probing again next time is fine
+
+    backends = dict(tools)
+    backends["pulse_running"] = False
+    if backends.get("pactl"):
+        pa_check = subprocess.run(["pactl", "info"], capture_output=True)
+        backends["pulse_running"] = pa_check.returncode == 0
+
+    _BACKENDS = backends
+    return backends
+
+
+# Frozen recorder argv lists: every input (rates, channels, target paths)
+# is fixed once the config is loaded, so each command is built at most
+# once per process and reused thereafter
+_RECORDING_CMD = None
+_HQ_RECORDING_CMD = None
+
+
 # Audio recording command (prefer sox, fallback to ffmpeg)
 def get_recording_command():
     """Get the appropriate recording command based on available tools"""
+    global _RECORDING_CMD
+    if _RECORDING_CMD is not None:
+        return _RECORDING_CMD
+    _RECORDING_CMD = _build_recording_command()
+    return _RECORDING_CMD
+
+
+def _build_recording_command():
+    """Build the transcription-rate recording command"""
+    backends = probe_audio_backends()
+
     # Try PulseAudio first (common on KDE)
-    pulse_result = subprocess.run(["which", "pactl"], capture_output=True)
-    if pulse_result.returncode == 0:
-        # Check if PulseAudio is running
-        pa_check = subprocess.run(["pactl", "info"], capture_output=True)
-        if pa_check.returncode == 0:
-            # Use PulseAudio with ffmpeg
-            if subprocess.run(["which", "ffmpeg"], capture_output=True).returncode == 0:
-                return [
-                    "ffmpeg",
-                    "-f", "pulse",
-                    "-ar", str(SAMPLE_RATE),
-                    "-ac", str(CHANNELS),
-                    "-sample_fmt", "s16",
-                    "-i", "default",  # PulseAudio default source
-                    "-y",  # Overwrite output file
-                    AUDIO_FILE
-                ]
-    
+    if backends.get("pulse_running") and backends.get("ffmpeg"):
+        return [
+            "ffmpeg",
+            "-f", "pulse",
+            "-ar", str(SAMPLE_RATE),
+            "-ac", str(CHANNELS),
+            "-sample_fmt", "s16",
+            "-i", "default",  # PulseAudio default source
+            "-y",  # Overwrite output file
+            AUDIO_FILE
+        ]
+
     # Check for sox (preferred for ALSA)
-    if subprocess.run(["which", "sox"], capture_output=True).returncode == 0:
+    if backends.get("sox"):
         # Use sox with ALSA device specification (this works reliably)
         return [
             "sox",
@@ -145,31 +226,9 @@ def get_recording_command():
             "-e", "signed-integer",
             AUDIO_FILE
         ]
-    
+
     # Fallback to ffmpeg with ALSA
-    if subprocess.run(["which", "ffmpeg"], capture_output=True).returncode == 0:
-        # Try to find the default ALSA capture device
-        try:
-            arecord_result = subprocess.run(
-                ["arecord", "-l"], capture_output=True, text=True
-            )
-            if arecord_result.returncode == 0:
-                # Use hw:1,0 as default (first capture card, first device)
-                # This is more reliable than "default"
-                return [
-                    "ffmpeg",
-                    "-f", "alsa",
-                    "-ar", str(SAMPLE_RATE),
-                    "-ac", str(CHANNELS),
-                    "-sample_fmt", "s16",
-                    "-i", "hw:1,0",  # Try first capture device explicitly
-                    "-y",
-                    AUDIO_FILE
-                ]
-        except Exception:
-            pass
-        
-        # Last resort: use default
+    if backends.get("ffmpeg"):
         return [
             "ffmpeg",
             "-f", "alsa",
@@ -180,41 +239,44 @@ def get_recording_command():
             "-y",
             AUDIO_FILE
         ]
-    
+
     raise RuntimeError("Neither sox nor ffmpeg found. Please install one of them.")
 
 
 def get_high_quality_recording_command():
     """Get the appropriate high-quality recording command based on available tools"""
+    global _HQ_RECORDING_CMD
+    if _HQ_RECORDING_CMD is not None:
+        return _HQ_RECORDING_CMD
+    _HQ_RECORDING_CMD = _build_high_quality_recording_command()
+    return _HQ_RECORDING_CMD
+
+
+def _build_high_quality_recording_command():
+    """Build the high-quality recording command"""
+    backends = probe_audio_backends()
+
+    # Determine ffmpeg sample format based on bit depth
+    if HQ_BIT_DEPTH in (24, 32):
+        sample_fmt = "s32"  # ffmpeg uses 32-bit for 24-bit samples
+    else:
+        sample_fmt = "s16"
+
     # Try PulseAudio first (common on KDE)
-    pulse_result = subprocess.run(["which", "pactl"], capture_output=True)
-    if pulse_result.returncode == 0:
-        # Check if PulseAudio is running
-        pa_check = subprocess.run(["pactl", "info"], capture_output=True)
-        if pa_check.returncode == 0:
-            # Use PulseAudio with ffmpeg
-            if subprocess.run(["which", "ffmpeg"], capture_output=True).returncode == 0:
-                # Determine sample format based on bit depth
-                if HQ_BIT_DEPTH == 24:
-                    sample_fmt = "s32"  # ffmpeg uses 32-bit for 24-bit samples
-                elif HQ_BIT_DEPTH == 32:
-                    sample_fmt = "s32"
-                else:
-                    sample_fmt = "s16"
-                
-                return [
-                    "ffmpeg",
-                    "-f", "pulse",
-                    "-ar", str(HQ_SAMPLE_RATE),
-                    "-ac", str(HQ_CHANNELS),
-                    "-sample_fmt", sample_fmt,
-                    "-i", "default",  # PulseAudio default source
-                    "-y",  # Overwrite output file
-                    HIGH_QUALITY_AUDIO_FILE
-                ]
-    
+    if backends.get("pulse_running") and backends.get("ffmpeg"):
+        return [
+            "ffmpeg",
+            "-f", "pulse",
+            "-ar", str(HQ_SAMPLE_RATE),
+            "-ac", str(HQ_CHANNELS),
+            "-sample_fmt", sample_fmt,
+            "-i", "default",  # PulseAudio default source
+            "-y",  # Overwrite output file
+            HIGH_QUALITY_AUDIO_FILE
+        ]
+
     # Check for sox (preferred for ALSA)
-    if subprocess.run(["which", "sox"], capture_output=True).returncode == 0:
+    if backends.get("sox"):
         # Use sox with ALSA device specification
         return [
             "sox",
@@ -226,38 +288,9 @@ def get_high_quality_recording_command():
             "-e", "signed-integer",
             HIGH_QUALITY_AUDIO_FILE
         ]
-    
+
     # Fallback to ffmpeg with ALSA
-    if subprocess.run(["which", "ffmpeg"], capture_output=True).returncode == 0:
-        # Determine sample format based on bit depth
-        if HQ_BIT_DEPTH == 24:
-            sample_fmt = "s32"  # ffmpeg uses 32-bit for 24-bit samples
-        elif HQ_BIT_DEPTH == 32:
-            sample_fmt = "s32"
-        else:
-            sample_fmt = "s16"
-        
-        # Try to find the default ALSA capture device
-        try:
-            arecord_result = subprocess.run(
-                ["arecord", "-l"], capture_output=True, text=True
-            )
-            if arecord_result.returncode == 0:
-                # Use hw:1,0 as default (first capture card, first device)
-                return [
-                    "ffmpeg",
-                    "-f", "alsa",
-                    "-ar", str(HQ_SAMPLE_RATE),
-                    "-ac", str(HQ_CHANNELS),
-                    "-sample_fmt", sample_fmt,
-                    "-i", "hw:1,0",  # Try first capture device explicitly
-                    "-y",
-                    HIGH_QUALITY_AUDIO_FILE
-                ]
-        except Exception:
-            pass
-        
-        # Last resort: use default
+    if backends.get("ffmpeg"):
         return [
             "ffmpeg",
             "-f", "alsa",
@@ -268,7 +301,7 @@ def get_high_quality_recording_command():
             "-y",
             HIGH_QUALITY_AUDIO_FILE
         ]
-    
+
     raise RuntimeError("Neither sox nor ffmpeg found. Please install one of them.")
 
 
@@ -306,8 +339,10 @@ def get_saved_audio_settings(quality):
 
 def convert_audio_quality(input_file, output_file, target_sample_rate, target_channels, target_bit_depth):
     """Convert audio to specified quality settings"""
+    backends = probe_audio_backends()
+
     # Try ffmpeg first (better quality resampling)
-    if subprocess.run(["which", "ffmpeg"], capture_output=True).returncode == 0:
+    if backends.get("ffmpeg"):
         # Determine sample format based on bit depth
         if target_bit_depth == 24:
             sample_fmt = "s32"  # ffmpeg uses 32-bit for 24-bit samples
@@ -330,9 +365,9 @@ def convert_audio_quality(input_file, output_file, target_sample_rate, target_ch
             return True
         else:
             print(f"Warning: ffmpeg conversion failed: {result.stderr[:200]}")
-    
+
     # Fallback to sox
-    if subprocess.run(["which", "sox"], capture_output=True).returncode == 0:
+    if backends.get("sox"):
         cmd = [
             "sox",
             input_file,
@@ -351,60 +386,150 @@ def convert_audio_quality(input_file, output_file, target_sample_rate, target_ch
     return False
 
 
-def downsample_audio_for_transcription(input_file, output_file):
-    """Downsample high-quality audio to transcription-optimized format"""
+def decode_pcm_for_transcription(input_file):
+    """Decode high-quality audio straight to raw transcription-rate PCM
+
+    Streams s16le mono PCM from ffmpeg/sox stdout instead of writing a
+    downsampled WAV that Whisper would immediately re-read: no disk
+    round trip, no WAV header parse. Returns the PCM bytes, or None.
+    """
+    backends = probe_audio_backends()
+
     # Try ffmpeg first (better quality resampling)
-    if subprocess.run(["which", "ffmpeg"], capture_output=True).returncode == 0:
+    if backends.get("ffmpeg"):
         cmd = [
             "ffmpeg",
             "-i", input_file,
             "-ar", str(SAMPLE_RATE),
             "-ac", str(CHANNELS),
-            "-sample_fmt", "s16",
-            "-y",  # Overwrite output file
-            output_file
+            "-f", "s16le",
+            "-"  # Raw PCM to stdout
         ]
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = subprocess.run(cmd, capture_output=True)
         if result.returncode == 0:
-            return True
+            return result.stdout
         else:
-            print(f"Warning: ffmpeg downsampling failed: {result.stderr[:200]}")
-    
+            print(f"Warning: ffmpeg decoding failed: {result.stderr.decode(errors='replace')[:200]}")
+
     # Fallback to sox
-    if subprocess.run(["which", "sox"], capture_output=True).returncode == 0:
+    if backends.get("sox"):
         cmd = [
             "sox",
             input_file,
             "-r", str(SAMPLE_RATE),
             "-c", str(CHANNELS),
-            "-b", str(BIT_DEPTH),
+            "-b", "16",  # Consumers interpret the raw stream as s16le
             "-e", "signed-integer",
-            output_file
+            "-t", "raw",
+            "-"  # Raw PCM to stdout
         ]
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = subprocess.run(cmd, capture_output=True)
         if result.returncode == 0:
-            return True
+            return result.stdout
         else:
-            print(f"Warning: sox downsampling failed: {result.stderr[:200]}")
-    
-    return False
+            print(f"Warning: sox decoding failed: {result.stderr.decode(errors='replace')[:200]}")
+
+    return None
 
 
 def send_notification(title, message, urgency="normal"):
-    """Send desktop notification using notify-send"""
+    """Send desktop notification using notify-send (fire-and-forget)
+
+    Uses Popen without waiting so we never block on the D-Bus round trip.
+    """
     try:
-        subprocess.run(
+        subprocess.Popen(
             ["notify-send", f"--urgency={urgency}", title, message],
-            check=False,
-            capture_output=True
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True
         )
     except Exception:
         pass  # Silently fail if notify-send is not available
 
 
+def file_size_or_neg1(path):
+    """File size via a single stat() call, or -1 if the file is missing
+
+    Replaces exists()+getsize() pairs: half the syscalls and no window
+    for the file to vanish between the two checks.
+    """
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return -1
+
+
+def wait_for_first_write(path, timeout=1.0):
+    """Wait until the recorder writes its first audio bytes to path
+
+    Uses inotify when available so we return the moment the first write
+    lands instead of sleeping a fixed interval; falls back to a short
+    polling loop otherwise. Returns True if the file has content.
+    """
+    try:
+        import inotify_simple
+    except ImportError:
+        inotify_simple = None
+
+    deadline = time.monotonic() + timeout
+
+    def _has_content():
+        return file_size_or_neg1(path) > 0
+
+    if _has_content():
+        return True
+
+    if inotify_simple is not None:
+        try:
+            watcher = inotify_simple.INotify()
+            watcher.add_watch(
+                os.path.dirname(path) or ".",
+                inotify_simple.flags.CREATE | inotify_simple.flags.MODIFY
+            )
+            target = os.path.basename(path)
+            try:
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return _has_content()
+                    for event in watcher.read(timeout=int(remaining * 1000)):
+                        if event.name == target and _has_content():
+                            return True
+            finally:
+                watcher.close()
+        except Exception:
+            pass  # Fall through to polling on any inotify problem
+
+    # Polling fallback: still much finer-grained than a fixed sleep
+    while time.monotonic() < deadline:
+        if _has_content():
+            return True
+        time.sleep(0.02)
+    return False
+
+
 def is_recording():
-    """Check if recording is in progress by checking lock file"""
-    return os.path.exists(LOCK_FILE)
+    """Check if recording is in progress via an advisory lock on LOCK_FILE
+
+    The recorder process inherits the locked fd, so the kernel releases
+    the lock the moment it dies: a crashed recorder can't leave a stale
+    "in progress" state, and two simultaneous toggles can't both think
+    nothing is running.
+    """
+    try:
+        fd = os.open(LOCK_FILE, os.O_RDONLY)
+    except OSError:
+        return False
+
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return False
+    except BlockingIOError:
+        return True
+    finally:
+        os.close(fd)  # Also releases the probe lock if we got it
 
 
 def start_recording():
@@ -421,29 +546,51 @@ def start_recording():
         # Debug: print the command being used
         print(f"Using high-quality recording command: {' '.join(cmd)}")
         
+        # Kick off the model load now so it overlaps with the user speaking
+        warm_up_daemon()
+
+        # Acquire the advisory lock before spawning so two simultaneous
+        # toggles can't both start. The recorder inherits this fd, so the
+        # kernel holds the lock exactly as long as the recorder lives.
+        # No O_TRUNC here: a losing opener must not wipe the winner's
+        # pid/pgid payload — truncate only once the lock is ours
+        lock_fd = os.open(LOCK_FILE, os.O_WRONLY | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(lock_fd)
+            print("Recording is already in progress!")
+            send_notification("Voice Tool", "Recording already in progress", "low")
+            return False
+        os.ftruncate(lock_fd, 0)
+
         # Start recording process
         # Use DEVNULL for stdout/stderr to avoid blocking, but log stderr to a file for debugging
         stderr_file = "/tmp/voice_rec_stderr.log"
         try:
             with open(stderr_file, "w") as stderr_f:
-                # Use shell=False but ensure process is fully detached
-                # Redirect stdin to avoid issues with terminal
+                # Redirect stdin to avoid issues with terminal.
+                # start_new_session detaches via the C fast path in
+                # _posixsubprocess; a preexec_fn callback would force the
+                # slow fork+exec path and run Python between fork and exec
                 process = subprocess.Popen(
                     cmd,
                     stdin=subprocess.DEVNULL,
                     stdout=subprocess.DEVNULL,
                     stderr=stderr_f,
-                    preexec_fn=os.setsid,  # Create new process group
-                    start_new_session=False  # setsid already does this
+                    start_new_session=True,
+                    pass_fds=(lock_fd,)  # Recorder holds the lock for its lifetime
                 )
         except Exception as e:
+            os.close(lock_fd)
             print(f"Error starting recording process: {e}")
             send_notification("Voice Tool", f"Failed to start recording: {e}", "critical")
             return False
         
-        # Give it a moment to start and verify it's running
-        time.sleep(0.5)
-        
+        # Wait for the recorder's first write (returns as soon as data lands,
+        # instead of a fixed sleep)
+        recorder_writing = wait_for_first_write(HIGH_QUALITY_AUDIO_FILE, timeout=1.0)
+
         # Check if process is still running
         if process.poll() is not None:
             # Process already terminated - read error
@@ -458,6 +605,7 @@ def start_recording():
             print(f"Error: Recording process terminated immediately: {error_msg}")
             send_notification("Voice Tool", f"Recording failed: {error_msg[:50]}", "critical")
             # Clean up
+            os.close(lock_fd)
             try:
                 if os.path.exists(HIGH_QUALITY_AUDIO_FILE):
                     os.remove(HIGH_QUALITY_AUDIO_FILE)
@@ -465,19 +613,11 @@ def start_recording():
                 pass
             return False
         
-        # Verify the audio file is being created and growing
-        initial_size = 0
-        if os.path.exists(HIGH_QUALITY_AUDIO_FILE):
-            initial_size = os.path.getsize(HIGH_QUALITY_AUDIO_FILE)
-        
-        # Wait a bit more and check if file is growing (proves recording is working)
-        time.sleep(0.5)
-        if os.path.exists(HIGH_QUALITY_AUDIO_FILE):
-            new_size = os.path.getsize(HIGH_QUALITY_AUDIO_FILE)
-            if new_size > initial_size:
-                print(f"Recording verified: file growing ({initial_size} -> {new_size} bytes)")
-            elif new_size == 0:
-                print("Warning: Audio file exists but is empty")
+        # Report whether the recorder has started writing audio data
+        if recorder_writing:
+            print("Recording verified: recorder is writing audio data")
+        elif os.path.exists(HIGH_QUALITY_AUDIO_FILE):
+            print("Warning: Audio file exists but is empty")
         else:
             print("Warning: Audio file not created yet")
         
@@ -493,6 +633,7 @@ def start_recording():
                 pass
             print(f"Error: Process terminated: {error_msg}")
             send_notification("Voice Tool", "Recording process died", "critical")
+            os.close(lock_fd)
             return False
         
         # Save process info to lock file
@@ -501,15 +642,12 @@ def start_recording():
         except Exception:
             pgid = None
         
-        lock_data = {
-            "pid": process.pid,
-            "pgid": pgid,  # Process group ID
-            "started_at": datetime.now().isoformat(),
-            "command": cmd
-        }
-        
-        with open(LOCK_FILE, "w") as f:
-            json.dump(lock_data, f)
+        # Tab-separated pid/pgid/started_at: no JSON parser needed on the
+        # stop path. Written through the locked fd; closing our copy leaves
+        # the recorder's inherited copy holding the lock
+        payload = f"{process.pid}\t{pgid if pgid is not None else ''}\t{datetime.now().isoformat()}\n".encode()
+        os.write(lock_fd, payload)
+        os.close(lock_fd)
         
         print(f"Recording started (PID: {process.pid}, PGID: {pgid})")
         send_notification("Voice Tool", "Recording started...", "normal")
@@ -521,7 +659,93 @@ def start_recording():
         return False
 
 
-def stop_recording():
+def wait_for_process_exit(pid, timeout=1.0):
+    """Wait until pid has fully exited, bounded by timeout
+
+    The recorder is not our child (it was launched by the previous toggle
+    invocation), so os.waitpid is tried first and /proc is polled as the
+    fallback. Returns as soon as the process is gone instead of sleeping
+    a fixed interval; sox flushes and closes its WAV on SIGTERM in
+    single-digit milliseconds.
+    """
+    try:
+        os.waitpid(pid, 0)
+        return True
+    except (ChildProcessError, OSError):
+        pass
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if not os.path.exists(f"/proc/{pid}"):
+            return True
+        time.sleep(0.01)
+    return not os.path.exists(f"/proc/{pid}")
+
+
+def persist_transcription(text):
+    """Save the transcription and, if enabled, an audio copy next to it"""
+    transcription_filepath = save_transcription(text)
+
+    # Save audio file next to transcription if enabled
+    if CONFIG.get("save_audio_file", True) and transcription_filepath:
+        try:
+            # Get the base name of the transcription file and change extension to .wav
+            audio_filepath = transcription_filepath.with_suffix(".wav")
+
+            # Get desired quality settings
+            saved_quality = CONFIG.get("saved_audio_quality", "high")
+            quality_settings = get_saved_audio_settings(saved_quality)
+
+            # Convert high-quality audio to desired quality
+            temp_converted_file = "/tmp/voice_capture_converted.wav"
+            if convert_audio_quality(
+                HIGH_QUALITY_AUDIO_FILE,
+                temp_converted_file,
+                quality_settings["sample_rate"],
+                quality_settings["channels"],
+                quality_settings["bit_depth"]
+            ):
+                # Copy the converted file to the transcription directory
+                shutil.copy2(temp_converted_file, audio_filepath)
+                # Clean up temporary converted file
+                try:
+                    os.remove(temp_converted_file)
+                except Exception:
+                    pass
+                quality_name = saved_quality.capitalize()
+                print(f"{quality_name}-quality audio file saved to {audio_filepath}")
+            else:
+                # Fallback: copy high-quality file if conversion fails
+                print(f"Warning: Audio conversion failed, saving high-quality version instead")
+                shutil.copy2(HIGH_QUALITY_AUDIO_FILE, audio_filepath)
+                print(f"High-quality audio file saved to {audio_filepath}")
+        except Exception as e:
+            print(f"Warning: Could not save audio file: {e}")
+
+
+def copy_to_clipboard(text):
+    """Copy transcribed text to the clipboard via xclip (or wl-copy on Wayland)
+
+    Piping straight to the clipboard tool is one fork and skips the
+    pyperclip import and its backend probing entirely.
+    """
+    if os.environ.get("WAYLAND_DISPLAY"):
+        cmd = ["wl-copy"]
+    else:
+        cmd = ["xclip", "-selection", "clipboard"]
+
+    try:
+        process = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+        process.communicate(text.encode("utf-8"))
+        if process.returncode == 0:
+            print(f"Text copied to clipboard: {text[:50]}...")
+        else:
+            print(f"Warning: Could not copy to clipboard ({cmd[0]} exited with {process.returncode})")
+    except Exception as e:
+        print(f"Warning: Could not copy to clipboard: {e}")
+
+
+async def stop_recording():
     """Stop recording, transcribe audio, and save results"""
     if not is_recording():
         print("No recording in progress!")
@@ -529,12 +753,12 @@ def stop_recording():
         return False
     
     try:
-        # Read lock file to get process info
+        # Read lock file to get process info (pid\tpgid\tstarted_at)
         with open(LOCK_FILE, "r") as f:
-            lock_data = json.load(f)
-        
-        pid = lock_data["pid"]
-        pgid = lock_data.get("pgid")  # Process group ID if available
+            fields = f.read().strip().split("\t")
+
+        pid = int(fields[0])
+        pgid = int(fields[1]) if len(fields) > 1 and fields[1] else None
         
         # Check if process is still running
         process_running = False
@@ -544,7 +768,7 @@ def stop_recording():
         except ProcessLookupError:
             print(f"Process {pid} not found (may have already terminated)")
             # Check if file exists and has content
-            if os.path.exists(HIGH_QUALITY_AUDIO_FILE) and os.path.getsize(HIGH_QUALITY_AUDIO_FILE) > 0:
+            if file_size_or_neg1(HIGH_QUALITY_AUDIO_FILE) > 0:
                 print("Process is gone but audio file exists with content - proceeding with transcription")
             else:
                 print("Process is gone and no valid audio file found")
@@ -556,7 +780,7 @@ def stop_recording():
                 if pgid:
                     try:
                         os.killpg(pgid, signal.SIGTERM)
-                        time.sleep(0.5)  # Give it more time to flush
+                        wait_for_process_exit(pid, timeout=0.5)
                         # Check if any process in the group still exists
                         try:
                             os.killpg(pgid, 0)
@@ -569,7 +793,7 @@ def stop_recording():
                 # Also try killing the specific process
                 try:
                     os.kill(pid, signal.SIGTERM)
-                    time.sleep(0.5)  # Give it time to flush buffers
+                    wait_for_process_exit(pid, timeout=0.5)
                     # Check if process still exists
                     try:
                         os.kill(pid, 0)
@@ -594,13 +818,15 @@ def stop_recording():
         
         # Remove lock file
         os.remove(LOCK_FILE)
+
+        # Wait only until the recorder has actually exited (and therefore
+        # flushed and closed the WAV) instead of a fixed 1-second sleep
+        if not wait_for_process_exit(pid, timeout=1.0):
+            print(f"Warning: Process {pid} still running after termination wait")
         
-        # Wait for the process to fully terminate and file to be written
-        # Give it time to flush buffers
-        time.sleep(1.0)
-        
-        # Check if high-quality audio file exists
-        if not os.path.exists(HIGH_QUALITY_AUDIO_FILE):
+        # Check the audio file's existence and size with a single stat
+        file_size = file_size_or_neg1(HIGH_QUALITY_AUDIO_FILE)
+        if file_size < 0:
             print("Error: High-quality audio file not found!")
             print("The recording process may have failed. Check microphone permissions and device selection.")
             # Check if process is still running (shouldn't be, but check anyway)
@@ -611,9 +837,7 @@ def stop_recording():
                 print(f"Process {pid} has terminated.")
             send_notification("Voice Tool", "Error: Audio file not found", "critical")
             return False
-        
-        # Check file size (should be > 0)
-        file_size = os.path.getsize(HIGH_QUALITY_AUDIO_FILE)
+
         if file_size == 0:
             print("Error: High-quality audio file is empty!")
             print("This usually means the microphone wasn't detected or accessed correctly.")
@@ -626,79 +850,47 @@ def stop_recording():
             print(f"Warning: Audio file is very small ({file_size} bytes). Recording may have failed.")
             send_notification("Voice Tool", "Warning: Audio file is very small", "normal")
         
-        print("Recording stopped. Downsampling for transcription...")
-        send_notification("Voice Tool", "Downsampling audio...", "normal")
-        
-        # Downsample high-quality audio for transcription
-        if not downsample_audio_for_transcription(HIGH_QUALITY_AUDIO_FILE, AUDIO_FILE):
-            print("Error: Failed to downsample audio for transcription")
-            send_notification("Voice Tool", "Error: Failed to downsample audio", "critical")
+        print("Recording stopped. Decoding audio for transcription...")
+        send_notification("Voice Tool", "Decoding audio...", "normal")
+
+        # Decode high-quality audio straight to in-memory PCM for transcription
+        pcm = decode_pcm_for_transcription(HIGH_QUALITY_AUDIO_FILE)
+        if pcm is None:
+            print("Error: Failed to decode audio for transcription")
+            send_notification("Voice Tool", "Error: Failed to decode audio", "critical")
             return False
-        
+
+        # Bail out before loading Whisper if there's nothing to transcribe
+        if not contains_speech(pcm):
+            print("No speech detected (recording silent or too short)")
+            send_notification("Voice Tool", "No speech detected", "low")
+            try:
+                os.remove(HIGH_QUALITY_AUDIO_FILE)
+            except Exception:
+                pass
+            return False
+
         print("Transcribing...")
         send_notification("Voice Tool", "Transcribing audio...", "normal")
-        
-        # Transcribe audio (using downsampled version)
-        transcribed_text = transcribe_audio()
-        
+
+        # Transcribe the decoded PCM off the event loop
+        transcribed_text = await asyncio.to_thread(transcribe_audio, pcm)
+
         if not transcribed_text:
             print("Error: Transcription failed or produced no text")
             send_notification("Voice Tool", "Transcription failed", "critical")
             return False
-        
-        # Save to file
-        transcription_filepath = save_transcription(transcribed_text)
-        
-        # Save audio file next to transcription if enabled
-        if CONFIG.get("save_audio_file", True) and transcription_filepath:
-            try:
-                # Get the base name of the transcription file and change extension to .wav
-                audio_filepath = transcription_filepath.with_suffix(".wav")
-                
-                # Get desired quality settings
-                saved_quality = CONFIG.get("saved_audio_quality", "high")
-                quality_settings = get_saved_audio_settings(saved_quality)
-                
-                # Convert high-quality audio to desired quality
-                temp_converted_file = "/tmp/voice_capture_converted.wav"
-                if convert_audio_quality(
-                    HIGH_QUALITY_AUDIO_FILE,
-                    temp_converted_file,
-                    quality_settings["sample_rate"],
-                    quality_settings["channels"],
-                    quality_settings["bit_depth"]
-                ):
-                    # Copy the converted file to the transcription directory
-                    shutil.copy2(temp_converted_file, audio_filepath)
-                    # Clean up temporary converted file
-                    try:
-                        os.remove(temp_converted_file)
-                    except Exception:
-                        pass
-                    quality_name = saved_quality.capitalize()
-                    print(f"{quality_name}-quality audio file saved to {audio_filepath}")
-                else:
-                    # Fallback: copy high-quality file if conversion fails
-                    print(f"Warning: Audio conversion failed, saving high-quality version instead")
-                    shutil.copy2(HIGH_QUALITY_AUDIO_FILE, audio_filepath)
-                    print(f"High-quality audio file saved to {audio_filepath}")
-            except Exception as e:
-                print(f"Warning: Could not save audio file: {e}")
-        
-        # Copy to clipboard
-        try:
-            pyperclip.copy(transcribed_text)
-            print(f"Text copied to clipboard: {transcribed_text[:50]}...")
-        except Exception as e:
-            print(f"Warning: Could not copy to clipboard: {e}")
-        
-        # Clean up temporary audio files
-        try:
-            os.remove(AUDIO_FILE)  # Remove downsampled version
-        except Exception:
-            pass
+
+        # Saving (transcription + audio copy) and the clipboard copy are
+        # independent; run them concurrently instead of back to back
+        await asyncio.gather(
+            asyncio.to_thread(persist_transcription, transcribed_text),
+            asyncio.to_thread(copy_to_clipboard, transcribed_text)
+        )
+
+        # Clean up temporary audio file
         try:
-            os.remove(HIGH_QUALITY_AUDIO_FILE)  # Remove high-quality version
+            os.remove(HIGH_QUALITY_AUDIO_FILE)
         except Exception:
             pass
         
@@ -709,42 +901,197 @@ def stop_recording():
     except Exception as e:
         print(f"Error stopping recording: {e}")
         send_notification("Voice Tool", f"Error: {e}", "critical")
-        # Clean up lock file on error
+        # No lock cleanup needed: the kernel releases the recorder's
+        # advisory lock when the process dies
+        return False
+
+
+def daemon_request(payload, timeout=600.0, body=None):
+    """Send a JSON request (plus optional binary body) to the daemon"""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(DAEMON_SOCKET)
+        sock.sendall((json.dumps(payload) + "\n").encode("utf-8"))
+        if body is not None:
+            sock.sendall(body)
+
+        # Read the newline-delimited JSON response
+        chunks = []
+        while True:
+            chunk = sock.recv(4096)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            if chunk.endswith(b"\n"):
+                break
+
+        return json.loads(b"".join(chunks).decode("utf-8"))
+    finally:
+        sock.close()
+
+
+def ensure_daemon_running():
+    """Start the transcription daemon if it isn't already listening"""
+    # Quick check: is the daemon already answering?
+    try:
+        response = daemon_request({"op": "ping"}, timeout=2.0)
+        if response.get("ok"):
+            return True
+    except Exception:
+        pass
+
+    # Launch the daemon detached so it outlives this toggle invocation
+    try:
+        subprocess.Popen(
+            [sys.executable, DAEMON_SCRIPT],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+    except Exception as e:
+        print(f"Warning: Could not start transcription daemon: {e}")
+        return False
+
+    # Wait for the socket to come up
+    for _ in range(50):
         try:
-            if os.path.exists(LOCK_FILE):
-                os.remove(LOCK_FILE)
+            response = daemon_request({"op": "ping"}, timeout=2.0)
+            if response.get("ok"):
+                return True
         except Exception:
-            pass
+            time.sleep(0.1)
+
+    print("Warning: Transcription daemon did not start in time")
+    return False
+
+
+def warm_up_daemon():
+    """Start loading the Whisper model in the daemon from a background thread
+
+    Called when recording starts, so the model load overlaps with the user
+    speaking and is already resident by the time stop_recording fires.
+    """
+    def _warm():
+        try:
+            if ensure_daemon_running():
+                # Short timeout: the daemon keeps loading after we stop waiting
+                daemon_request({"op": "warmup"}, timeout=1.0)
+        except Exception:
+            pass  # Warm-up is best-effort; transcription will load the model if needed
+
+    threading.Thread(target=_warm).start()
+
+
+# Silence gate thresholds (checked before any Whisper work)
+MIN_SPEECH_DURATION = 0.5  # seconds
+MIN_SPEECH_RMS = 500.0     # on the s16 amplitude scale
+
+
+def contains_speech(pcm):
+    """Cheap RMS/duration check on raw s16le PCM
+
+    Costs ~1 ms with numpy and lets silent or sub-half-second captures
+    short-circuit before the model is even loaded. Returns True when in
+    doubt (e.g. numpy unavailable) so real speech is never dropped.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return True
+
+    audio = np.frombuffer(pcm, dtype=np.int16)
+    if len(audio) / SAMPLE_RATE < MIN_SPEECH_DURATION:
         return False
 
+    rms = np.sqrt(np.mean(audio.astype(np.float32) ** 2))
+    return rms >= MIN_SPEECH_RMS
+
+
+def transcribe_audio(pcm):
+    """Transcribe raw s16le PCM using faster-whisper (via the daemon if available)"""
+    # Prefer the daemon: it keeps the model loaded across invocations,
+    # so we skip the cold model load on every toggle
+    if ensure_daemon_running():
+        try:
+            response = daemon_request(
+                {"op": "transcribe_pcm", "nbytes": len(pcm), "sample_rate": SAMPLE_RATE},
+                body=pcm
+            )
+            if response.get("ok"):
+                return response.get("text", "")
+            print(f"Warning: Daemon transcription failed: {response.get('error')}")
+        except Exception as e:
+            print(f"Warning: Could not reach transcription daemon: {e}")
+
+    # Fallback: load the model in-process (slow path). faster_whisper is
+    # only imported inside create_whisper_model, after it has decided
+    # whether to export HF_HUB_OFFLINE — the hub reads that at import time
+    try:
+        from voice_toold import create_whisper_model
+        import numpy as np
+    except ImportError as e:
+        print(f"Error: Missing required library: {e}")
+        print("Please run: pip install -r requirements.txt")
+        return None
 
-def transcribe_audio():
-    """Transcribe audio file using faster-whisper"""
     try:
+        # Zero-copy view of the PCM; single multiply with an explicit dtype
+        # avoids the int16->float32 copy plus float64 divide temporary
+        samples = np.frombuffer(memoryview(pcm), dtype=np.int16)
+        audio = np.multiply(samples, np.float32(1.0 / 32768.0), dtype=np.float32)
+        duration = len(audio) / SAMPLE_RATE
+
         print(f"Loading Whisper model: {MODEL_NAME}...")
-        # Use CPU with int8 quantization for efficiency
-        model = WhisperModel(MODEL_NAME, device="cpu", compute_type="int8")
-        
+        # int8 CPU model from the pinned local cache
+        model = create_whisper_model(MODEL_NAME)
+
         print("Transcribing audio...")
-        segments, info = model.transcribe(
-            AUDIO_FILE,
-            beam_size=5,
-            language="en"
-        )
-        
+        try:
+            from faster_whisper import BatchedInferencePipeline
+            from voice_toold import batch_size_for_duration
+
+            pipeline = BatchedInferencePipeline(model=model)
+            segments, info = pipeline.transcribe(
+                audio,
+                batch_size=batch_size_for_duration(duration),
+                vad_filter=True,
+                vad_parameters=dict(min_silence_duration_ms=500),
+                beam_size=BEAM_SIZE,
+                language="en",
+                condition_on_previous_text=False,
+                without_timestamps=True
+            )
+        except ImportError:
+            # Older faster-whisper without BatchedInferencePipeline
+            segments, info = model.transcribe(
+                audio,
+                vad_filter=True,
+                vad_parameters=dict(min_silence_duration_ms=500),
+                beam_size=BEAM_SIZE,
+                language="en",
+                condition_on_previous_text=False,
+                without_timestamps=True
+            )
+
         # Collect all segments
         text_parts = []
         for segment in segments:
             text_parts.append(segment.text.strip())
-        
+
         full_text = " ".join(text_parts).strip()
         return full_text
-        
+
     except Exception as e:
         print(f"Error during transcription: {e}")
         return None
 
 
+# Separator line for saved transcriptions (built once, reused per save)
+TRANSCRIPTION_SEP = b"=" * 80 + b"\n"
+
+
 def save_transcription(text):
     """Save transcribed text to file based on configuration options"""
     # Get filename options from config
@@ -784,12 +1131,19 @@ def save_transcription(text):
     
     filepath = transcriptions_dir / filename
     
-    # Write transcription to file
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(f"Transcription: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write("=" * 80 + "\n")
-        f.write(f"{text}\n")
-        f.write("=" * 80 + "\n")
+    # Write the whole transcription as one preformatted blob in a single
+    # os.write, skipping the text-mode codec path and per-call buffering
+    blob = (
+        f"Transcription: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n".encode("utf-8")
+        + TRANSCRIPTION_SEP
+        + text.encode("utf-8") + b"\n"
+        + TRANSCRIPTION_SEP
+    )
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, blob)
+    finally:
+        os.close(fd)
     
     print(f"Transcription saved to {filepath}")
     
@@ -800,7 +1154,7 @@ def save_transcription(text):
 def main():
     """Main toggle function"""
     if is_recording():
-        stop_recording()
+        asyncio.run(stop_recording())
     else:
         start_recording()
 
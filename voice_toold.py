@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Transcription daemon for the Voice-to-Text Toggle Utility
+Keeps a single faster-whisper model resident in memory and serves
+transcription requests over a Unix domain socket, so the model is loaded
+once instead of on every stop_recording call.
+"""
+
+import os
+import sys
+import json
+import math
+import wave
+import socket
+import socketserver
+import threading
+
+
+def available_cpus():
+    """Number of CPUs this process may actually run on"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+# Pin OpenMP/MKL threading to the available cores before CTranslate2 is
+# imported, so the int8 encoder GEMMs use all of them without oversubscribing
+os.environ.setdefault("OMP_NUM_THREADS", str(available_cpus()))
+os.environ.setdefault("MKL_NUM_THREADS", str(available_cpus()))
+
+# Socket path shared with the voice_tool.py client
+SOCKET_PATH = "/tmp/voice_toold.sock"
+
+# Configuration file path (same file the CLI uses)
+CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.json")
+
+DEFAULT_MODEL_NAME = "base.en"
+DEFAULT_BEAM_SIZE = 1
+
+# Local model cache: pinning download_root (and going offline once the
+# model is on disk) skips HuggingFace hub resolution and ETag checks
+MODEL_CACHE_DIR = os.path.expanduser("~/.cache/voice_tool/models")
+
+
+def model_cached_locally(model_name):
+    """True if a complete converted snapshot of model_name is in the cache
+
+    Hub snapshots live at models--<org>--faster-whisper-<name>/snapshots/
+    <revision>/. The top-level directory is created when a download
+    *starts*, so an interrupted download must not count as cached: require
+    the converted weights (model.bin) in a snapshot of the exact model.
+    """
+    suffix = f"--faster-whisper-{model_name}"
+    try:
+        entries = os.listdir(MODEL_CACHE_DIR)
+    except OSError:
+        return False
+
+    for entry in entries:
+        if not (entry.startswith("models--") and entry.endswith(suffix)):
+            continue
+        snapshots_dir = os.path.join(MODEL_CACHE_DIR, entry, "snapshots")
+        try:
+            revisions = os.listdir(snapshots_dir)
+        except OSError:
+            continue
+        for revision in revisions:
+            if os.path.exists(os.path.join(snapshots_dir, revision, "model.bin")):
+                return True
+    return False
+
+
+def create_whisper_model(model_name):
+    """Construct the int8 CPU WhisperModel with the local cache pinned"""
+    os.makedirs(MODEL_CACHE_DIR, exist_ok=True)
+    local_only = model_cached_locally(model_name)
+    if local_only:
+        # Model already on disk: forbid hub HTTP round trips entirely
+        os.environ.setdefault("HF_HUB_OFFLINE", "1")
+
+    from faster_whisper import WhisperModel
+
+    model_kwargs = dict(
+        device="cpu",
+        compute_type="int8",
+        cpu_threads=available_cpus(),
+        num_workers=1,
+        download_root=MODEL_CACHE_DIR
+    )
+
+    try:
+        return WhisperModel(model_name, local_files_only=local_only, **model_kwargs)
+    except Exception as e:
+        if not local_only:
+            raise
+        # The cached snapshot looked complete but didn't load (e.g. a
+        # corrupt file): retry once with downloads allowed instead of
+        # failing permanently until the user deletes the cache
+        print(f"Warning: Cached model load failed ({e}); retrying with downloads allowed")
+        os.environ.pop("HF_HUB_OFFLINE", None)
+        try:
+            # huggingface_hub latches the env var at import time
+            import huggingface_hub.constants as hub_constants
+            hub_constants.HF_HUB_OFFLINE = False
+        except Exception:
+            pass
+        return WhisperModel(model_name, local_files_only=False, **model_kwargs)
+
+
+def load_config():
+    """Read config.json, returning an empty dict if missing or unreadable"""
+    try:
+        with open(CONFIG_FILE, "r") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def audio_duration_seconds(path):
+    """Get the duration of a WAV file in seconds (0.0 if unreadable)"""
+    try:
+        with wave.open(path, "rb") as wav:
+            rate = wav.getframerate()
+            if rate > 0:
+                return wav.getnframes() / rate
+    except Exception:
+        pass
+    return 0.0
+
+
+def batch_size_for_duration(duration):
+    """Pick a batch size: one encoder batch per 30s window, capped at 8"""
+    return min(8, max(1, math.ceil(duration / 30)))
+
+
+class TranscriptionServer(socketserver.ThreadingUnixStreamServer):
+    """Unix socket server that lazily loads and holds the Whisper model
+
+    Threaded so pings keep answering while a long warmup or transcription
+    is in flight: a client that can't reach the daemon assumes it is dead
+    and would spawn a duplicate. Model init and transcription themselves
+    are serialized with locks.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.model = None
+        self.pipeline = None
+        self._init_lock = threading.RLock()
+        self._transcribe_lock = threading.Lock()
+        self._config_mtime = self._current_config_mtime()
+        config = load_config()
+        self.model_name = config.get("model_name", DEFAULT_MODEL_NAME)
+        self.beam_size = config.get("beam_size", DEFAULT_BEAM_SIZE)
+
+    @staticmethod
+    def _current_config_mtime():
+        try:
+            return os.stat(CONFIG_FILE).st_mtime
+        except OSError:
+            return None
+
+    def refresh_config(self):
+        """Pick up config.json edits made since the last request
+
+        The daemon is long-lived, so without this a documented workflow —
+        editing config.json — would silently keep serving the old model
+        until the user found and killed the daemon. The mtime check costs
+        one stat; a model_name change drops the resident model so the
+        next load uses the new one.
+        """
+        mtime = self._current_config_mtime()
+        if mtime == self._config_mtime:
+            return
+        with self._init_lock:
+            self._config_mtime = mtime
+            config = load_config()
+            model_name = config.get("model_name", DEFAULT_MODEL_NAME)
+            self.beam_size = config.get("beam_size", DEFAULT_BEAM_SIZE)
+            if model_name != self.model_name:
+                print(f"Config changed: switching model {self.model_name} -> {model_name}")
+                self.model_name = model_name
+                self.model = None
+                self.pipeline = None
+
+    def get_model(self):
+        """Load the Whisper model on first use and keep it in memory"""
+        self.refresh_config()
+        with self._init_lock:
+            if self.model is None:
+                # The heavy faster_whisper import happens inside
+                # create_whisper_model, so the daemon starts listening
+                # immediately and pays the load on the first request
+                print(f"Loading Whisper model: {self.model_name}...")
+                self.model = create_whisper_model(self.model_name)
+                print("Model loaded.")
+            return self.model
+
+    def get_pipeline(self):
+        """Wrap the model in a batched pipeline (None if unsupported)"""
+        with self._init_lock:
+            if self.pipeline is None:
+                model = self.get_model()
+                try:
+                    from faster_whisper import BatchedInferencePipeline
+                except ImportError:
+                    return None
+                self.pipeline = BatchedInferencePipeline(model=model)
+            return self.pipeline
+
+    def transcribe(self, audio, duration):
+        """Transcribe audio (file path or float32 array) and join the text
+
+        `audio` is whatever faster-whisper accepts: a file path or a
+        16 kHz mono float32 numpy array. `duration` is in seconds and
+        only drives the batch-size heuristic. One transcription runs at
+        a time; concurrent requests queue on the lock.
+        """
+        with self._transcribe_lock:
+            return self._transcribe_locked(audio, duration)
+
+    def _transcribe_locked(self, audio, duration):
+        self.refresh_config()
+        pipeline = self.get_pipeline()
+        if pipeline is not None:
+            # Batched pipeline: VAD-produced chunks go through the encoder
+            # in batches instead of one 30s window at a time
+            segments, info = pipeline.transcribe(
+                audio,
+                batch_size=batch_size_for_duration(duration),
+                vad_filter=True,
+                vad_parameters=dict(min_silence_duration_ms=500),
+                beam_size=self.beam_size,
+                language="en",
+                condition_on_previous_text=False,
+                without_timestamps=True
+            )
+        else:
+            # Older faster-whisper without BatchedInferencePipeline
+            segments, info = self.get_model().transcribe(
+                audio,
+                vad_filter=True,
+                vad_parameters=dict(min_silence_duration_ms=500),
+                beam_size=self.beam_size,
+                language="en",
+                condition_on_previous_text=False,
+                without_timestamps=True
+            )
+
+        text_parts = []
+        for segment in segments:
+            text_parts.append(segment.text.strip())
+
+        return " ".join(text_parts).strip()
+
+    def transcribe_path(self, path):
+        """Transcribe an audio file from disk"""
+        return self.transcribe(path, audio_duration_seconds(path))
+
+    def transcribe_pcm(self, pcm, sample_rate):
+        """Transcribe raw s16le mono PCM sent over the socket
+
+        Avoids any disk round trip: the client streams the decoded PCM
+        directly and we hand Whisper an in-memory float32 array.
+        """
+        import numpy as np
+
+        # Zero-copy view of the buffer; the scale to float32 is done in one
+        # multiply with an explicit dtype so no float64 temporary is built
+        samples = np.frombuffer(memoryview(pcm), dtype=np.int16)
+        audio = np.multiply(samples, np.float32(1.0 / 32768.0), dtype=np.float32)
+        duration = len(audio) / sample_rate if sample_rate > 0 else 0.0
+        return self.transcribe(audio, duration)
+
+
+class TranscriptionHandler(socketserver.StreamRequestHandler):
+    """Handles one newline-delimited JSON request per connection"""
+
+    # Applied to the connection in setup(): a peer that stalls mid-request
+    # without closing must time out instead of pinning a handler thread
+    # forever. Generous vs the ms it takes to send a clip's PCM locally
+    timeout = 30
+
+    def handle(self):
+        try:
+            line = self.rfile.readline()
+            if not line:
+                return
+            request = json.loads(line.decode("utf-8"))
+            op = request.get("op")
+
+            if op == "ping":
+                response = {"ok": True}
+            elif op == "warmup":
+                self.server.get_model()
+                response = {"ok": True}
+            elif op == "transcribe":
+                path = request.get("path")
+                if not path or not os.path.exists(path):
+                    response = {"ok": False, "error": f"Audio file not found: {path}"}
+                else:
+                    text = self.server.transcribe_path(path)
+                    response = {"ok": True, "text": text}
+            elif op == "transcribe_pcm":
+                # The JSON header is followed by nbytes of raw s16le PCM.
+                # Drain into a single amortized-growth bytearray; a
+                # memoryview of it later feeds numpy with no extra copy
+                nbytes = int(request.get("nbytes", 0))
+                sample_rate = int(request.get("sample_rate", 16000))
+                pcm = bytearray()
+                while len(pcm) < nbytes:
+                    chunk = self.rfile.read(min(65536, nbytes - len(pcm)))
+                    if not chunk:
+                        break
+                    pcm.extend(chunk)
+                if len(pcm) < nbytes:
+                    response = {"ok": False, "error": "Truncated PCM payload"}
+                else:
+                    text = self.server.transcribe_pcm(pcm, sample_rate)
+                    response = {"ok": True, "text": text}
+            else:
+                response = {"ok": False, "error": f"Unknown op: {op}"}
+        except Exception as e:
+            response = {"ok": False, "error": str(e)}
+
+        try:
+            self.wfile.write((json.dumps(response) + "\n").encode("utf-8"))
+        except Exception:
+            pass  # Client went away; nothing to do
+
+
+def socket_in_use(path):
+    """True if a live daemon already accepts connections on path"""
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    probe.settimeout(1.0)
+    try:
+        probe.connect(path)
+        return True
+    except OSError:
+        return False
+    finally:
+        probe.close()
+
+
+def main():
+    """Start the transcription daemon"""
+    if os.path.exists(SOCKET_PATH):
+        # Never unlink a socket another daemon is serving: that would
+        # orphan a model-resident process. Only clean up dead leftovers
+        if socket_in_use(SOCKET_PATH):
+            print(f"Another daemon is already listening on {SOCKET_PATH}; exiting.")
+            return
+        try:
+            os.remove(SOCKET_PATH)
+        except Exception as e:
+            print(f"Error: Could not remove stale socket: {e}")
+            sys.exit(1)
+
+    server = TranscriptionServer(SOCKET_PATH, TranscriptionHandler)
+    print(f"Transcription daemon listening on {SOCKET_PATH}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        try:
+            os.remove(SOCKET_PATH)
+        except Exception:
+            pass
+
+
+if __name__ == "__main__":
+    main()